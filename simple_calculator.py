@@ -28,6 +28,9 @@ def divide(a: float, b: float) -> float:
     return a / b
 
 
+OPERATIONS = {"+": add, "-": subtract, "*": multiply, "/": divide}
+
+
 def get_number(prompt: str) -> float:
     """Prompt the user for a number until a valid value is provided."""
     while True:
@@ -40,13 +43,12 @@ def get_number(prompt: str) -> float:
 
 def get_operation() -> str:
     """Prompt the user to choose a valid arithmetic operation."""
-    operations = {"+": add, "-": subtract, "*": multiply, "/": divide}
     prompt = "Choose an operation (+, -, *, /): "
     while True:
         choice = input(prompt).strip()
-        if choice in operations:
+        if choice in OPERATIONS:
             return choice
-        print(f"Invalid operation: '{choice}'. Please select one of {', '.join(operations.keys())}.")
+        print(f"Invalid operation: '{choice}'. Please select one of {', '.join(OPERATIONS.keys())}.")
 
 
 def calculate() -> None:
@@ -56,8 +58,7 @@ def calculate() -> None:
     number2 = get_number("Enter the second number: ")
     operation = get_operation()
 
-    operations = {"+": add, "-": subtract, "*": multiply, "/": divide}
-    operation_func = operations[operation]
+    operation_func = OPERATIONS[operation]
 
     try:
         result = operation_func(number1, number2)